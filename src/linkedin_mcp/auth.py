@@ -13,6 +13,9 @@ import httpx
 
 from linkedin_mcp.config import Settings, TokenStore
 
+# Headers for the form-encoded token endpoint requests.
+_FORM_HEADERS = {"Content-Type": "application/x-www-form-urlencoded"}
+
 
 class LinkedInAuth:
     """Handles LinkedIn OAuth 2.0 3-legged authentication flow."""
@@ -64,7 +67,7 @@ class LinkedInAuth:
             response = await client.post(
                 self.settings.token_url,
                 data=data,
-                headers={"Content-Type": "application/x-www-form-urlencoded"},
+                headers=_FORM_HEADERS,
             )
             response.raise_for_status()
             token_data = response.json()
@@ -101,7 +104,7 @@ class LinkedInAuth:
             response = await client.post(
                 self.settings.token_url,
                 data=data,
-                headers={"Content-Type": "application/x-www-form-urlencoded"},
+                headers=_FORM_HEADERS,
             )
             response.raise_for_status()
             token_data = response.json()
@@ -13,7 +13,6 @@ from __future__ import annotations
 import json
 from typing import Any
 
-import uvicorn
 from fastapi import FastAPI, HTTPException, Query, Request
 from fastapi.responses import HTMLResponse, RedirectResponse
 from pydantic import BaseModel
@@ -461,6 +460,10 @@ async def health():
 
 def main():
     """Entry point for running the FastAPI server."""
+    # Imported lazily so non-server importers of this module (e.g. tooling)
+    # don't load uvicorn; it is only needed to launch the server.
+    import uvicorn
+
     uvicorn.run(
         "linkedin_mcp.fastapi_app:app",
         host=settings.fastapi_host,
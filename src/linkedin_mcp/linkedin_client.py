@@ -32,11 +32,8 @@ class LinkedInClient:
         self.access_token = access_token
         self.base_url = settings.api_base_url
         self.api_version = settings.linkedin_api_version
-
-    @property
-    def _default_headers(self) -> dict[str, str]:
-        return {
-            "Authorization": f"Bearer {self.access_token}",
+        self._default_headers: dict[str, str] = {
+            "Authorization": f"Bearer {access_token}",
             "X-Restli-Protocol-Version": "2.0.0",
             "LinkedIn-Version": self.api_version,
             "Content-Type": "application/json",
@@ -604,6 +604,39 @@ async def linkedin_withdraw_invitation(invitation_urn: str) -> str:
 # ===========================================================================
 
 
+# Tool names are tuples, but the outer dict stays a plain (mutable) dict:
+# json.dumps cannot serialize a MappingProxyType.
+_AVAILABLE_TOOLS: dict[str, tuple[str, ...]] = {
+    "auth": ("linkedin_auth_status", "linkedin_get_auth_url"),
+    "profiles": (
+        "linkedin_get_my_profile",
+        "linkedin_get_my_profile_details",
+        "linkedin_get_profile",
+        "linkedin_get_connections",
+        "linkedin_search_people",
+        "linkedin_search_connections",
+    ),
+    "posts": (
+        "linkedin_create_text_post",
+        "linkedin_create_link_post",
+        "linkedin_create_image_post",
+        "linkedin_get_my_posts",
+        "linkedin_get_post",
+        "linkedin_delete_post",
+        "linkedin_reshare_post",
+    ),
+    "invitations": (
+        "linkedin_send_invitation",
+        "linkedin_send_invitation_by_email",
+        "linkedin_get_received_invitations",
+        "linkedin_get_sent_invitations",
+        "linkedin_accept_invitation",
+        "linkedin_ignore_invitation",
+        "linkedin_withdraw_invitation",
+    ),
+}
+
+
 @mcp.resource("linkedin://status")
 def get_status() -> str:
     """Get the current LinkedIn MCP server status and authentication state."""
@@ -612,35 +645,7 @@ def get_status() -> str:
         "version": "1.0.0",
         "authenticated": auth_manager.is_authenticated(),
         "api_version": settings.linkedin_api_version,
-        "available_tools": {
-            "auth": ["linkedin_auth_status", "linkedin_get_auth_url"],
-            "profiles": [
-                "linkedin_get_my_profile",
-                "linkedin_get_my_profile_details",
-                "linkedin_get_profile",
-                "linkedin_get_connections",
-                "linkedin_search_people",
-                "linkedin_search_connections",
-            ],
-            "posts": [
-                "linkedin_create_text_post",
-                "linkedin_create_link_post",
-                "linkedin_create_image_post",
-                "linkedin_get_my_posts",
-                "linkedin_get_post",
-                "linkedin_delete_post",
-                "linkedin_reshare_post",
-            ],
-            "invitations": [
-                "linkedin_send_invitation",
-                "linkedin_send_invitation_by_email",
-                "linkedin_get_received_invitations",
-                "linkedin_get_sent_invitations",
-                "linkedin_accept_invitation",
-                "linkedin_ignore_invitation",
-                "linkedin_withdraw_invitation",
-            ],
-        },
+        "available_tools": _AVAILABLE_TOOLS,
     }, indent=2)
 
 
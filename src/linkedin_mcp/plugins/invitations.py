@@ -19,6 +19,8 @@ from linkedin_mcp.linkedin_client import LinkedInClient
 class InvitationPlugin:
     """Plugin for LinkedIn invitation/connection request operations."""
 
+    __slots__ = ("client",)
+
     def __init__(self, client: LinkedInClient):
         self.client = client
 
@@ -44,16 +46,10 @@ class InvitationPlugin:
         """
         invitee_urn = f"urn:li:person:{person_id}"
 
-        body: dict[str, Any] = {
-            "invitee": invitee_urn,
-            "message": {
-                "text": message[:300] if message else "",
-            },
-        }
-
-        # If no message, remove the message field entirely
-        if not message:
-            body.pop("message", None)
+        body: dict[str, Any] = {"invitee": invitee_urn}
+        # Only include the message field when there is a message
+        if message:
+            body["message"] = {"text": message[:300]}
 
         return await self.client.post("/v2/invitations", json_body=body)
 
@@ -84,13 +80,9 @@ class InvitationPlugin:
                     "profileId": email,
                 }
             },
-            "message": {
-                "text": message[:300] if message else "",
-            },
         }
-
-        if not message:
-            body.pop("message", None)
+        if message:
+            body["message"] = {"text": message[:300]}
 
         return await self.client.post("/v2/invitations", json_body=body)
 
@@ -21,12 +21,30 @@ import httpx
 from linkedin_mcp.linkedin_client import LinkedInClient
 
 
+def _main_feed_distribution() -> dict[str, Any]:
+    """Build the standard main-feed distribution block for a new post."""
+    return {
+        "feedDistribution": "MAIN_FEED",
+        "targetEntities": [],
+        "thirdPartyDistributionChannels": [],
+    }
+
+
 class PostPlugin:
     """Plugin for LinkedIn post publishing operations."""
 
+    __slots__ = ("client",)
+
     def __init__(self, client: LinkedInClient):
         self.client = client
 
+    async def _resolve_author(self, author_urn: str | None) -> str:
+        """Return author_urn, defaulting to the authenticated user's URN."""
+        if author_urn:
+            return author_urn
+        user_id = await self.client.get_current_user_id()
+        return f"urn:li:person:{user_id}"
+
     async def create_text_post(
         self,
         text: str,
@@ -45,19 +63,13 @@ class PostPlugin:
         Returns:
             Dict with post URN in '_restli_id' key.
         """
-        if not author_urn:
-            user_id = await self.client.get_current_user_id()
-            author_urn = f"urn:li:person:{user_id}"
+        author_urn = await self._resolve_author(author_urn)
 
         body = {
             "author": author_urn,
             "commentary": text,
             "visibility": visibility,
-            "distribution": {
-                "feedDistribution": "MAIN_FEED",
-                "targetEntities": [],
-                "thirdPartyDistributionChannels": [],
-            },
+            "distribution": _main_feed_distribution(),
             "lifecycleState": "PUBLISHED",
             "isReshareDisabledByAuthor": False,
         }
@@ -85,9 +97,7 @@ class PostPlugin:
         Returns:
             Dict with post URN.
         """
-        if not author_urn:
-            user_id = await self.client.get_current_user_id()
-            author_urn = f"urn:li:person:{user_id}"
+        author_urn = await self._resolve_author(author_urn)
 
         article: dict[str, Any] = {"source": link_url}
         if link_title:
@@ -99,11 +109,7 @@ class PostPlugin:
             "author": author_urn,
             "commentary": text,
             "visibility": visibility,
-            "distribution": {
-                "feedDistribution": "MAIN_FEED",
-                "targetEntities": [],
-                "thirdPartyDistributionChannels": [],
-            },
+            "distribution": _main_feed_distribution(),
             "content": {"article": article},
             "lifecycleState": "PUBLISHED",
             "isReshareDisabledByAuthor": False,
@@ -135,9 +141,7 @@ class PostPlugin:
         Returns:
             Dict with post URN.
         """
-        if not author_urn:
-            user_id = await self.client.get_current_user_id()
-            author_urn = f"urn:li:person:{user_id}"
+        author_urn = await self._resolve_author(author_urn)
 
         # Step 1: Initialize upload
         init_body = {"initializeUploadRequest": {"owner": author_urn}}
@@ -167,11 +171,7 @@ class PostPlugin:
             "author": author_urn,
             "commentary": text,
             "visibility": visibility,
-            "distribution": {
-                "feedDistribution": "MAIN_FEED",
-                "targetEntities": [],
-                "thirdPartyDistributionChannels": [],
-            },
+            "distribution": _main_feed_distribution(),
             "content": {
                 "media": {
                     "altText": alt_text,
@@ -207,9 +207,7 @@ class PostPlugin:
         Returns:
             Paginated list of posts.
         """
-        if not author_urn:
-            user_id = await self.client.get_current_user_id()
-            author_urn = f"urn:li:person:{user_id}"
+        author_urn = await self._resolve_author(author_urn)
 
         encoded_author = self.client.encode_urn(author_urn)
         return await self.client.get(
@@ -252,19 +250,13 @@ class PostPlugin:
         Returns:
             Dict with reshare post URN.
         """
-        if not author_urn:
-            user_id = await self.client.get_current_user_id()
-            author_urn = f"urn:li:person:{user_id}"
+        author_urn = await self._resolve_author(author_urn)
 
         body = {
             "author": author_urn,
             "commentary": text,
             "visibility": visibility,
-            "distribution": {
-                "feedDistribution": "MAIN_FEED",
-                "targetEntities": [],
-                "thirdPartyDistributionChannels": [],
-            },
+            "distribution": _main_feed_distribution(),
             "lifecycleState": "PUBLISHED",
             "reshareContext": {"parent": original_post_urn},
         }
@@ -19,6 +19,8 @@ from linkedin_mcp.linkedin_client import LinkedInClient
 class ProfilePlugin:
     """Plugin for LinkedIn profile search and retrieval operations."""
 
+    __slots__ = ("client",)
+
     def __init__(self, client: LinkedInClient):
         self.client = client
 